@@ -9,13 +9,13 @@ Utils functions for tesseroid forward modelling.
 """
 
 import numpy as np
-from numba import jit
+from numba import jit, prange
 from numpy.polynomial.legendre import leggauss
 
-from .utils import distance_spherical
+from .utils import distance_spherical, distance_spherical_core
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=True)
 def gauss_legendre_quadrature(
     longitude,
     cosphi,
@@ -58,21 +58,51 @@ def gauss_legendre_quadrature(
         meters.
     density : float
         Density of the tesseroid in SI units.
-    glq_nodes : list
-        Unscaled location of GLQ nodes for each direction.
-    glq_weights : list
-        GLQ weigths for each node for each direction.
+    glq_nodes : 2d-array
+        Unscaled location of GLQ nodes for each direction, one row per
+        direction.
+    glq_weights : 2d-array
+        GLQ weigths for each node for each direction, one row per direction.
     kernel : func
         Kernel function for the gravitational field of point masses.
 
     """
+    # Unpack nodes and weights
+    lon_nodes, lat_nodes, rad_nodes = glq_nodes[0], glq_nodes[1], glq_nodes[2]
+    lon_weights, lat_weights, rad_weights = (
+        glq_weights[0],
+        glq_weights[1],
+        glq_weights[2],
+    )
+    # Use the specialized kernel for the default (2, 2, 2) GLQ degrees: its
+    # weights are identically one and its nodes are symmetric, so the
+    # quadrature can be fully unrolled without weight products.
+    # The row sizes alone can't discriminate the degrees since the packed
+    # rows are padded to the largest one, so check the weights as well: only
+    # a genuine degree 2 direction has a first weight of one (a padded
+    # degree 1 row carries the weight 2 of its single node)
+    if (
+        lon_nodes.size == 2
+        and lon_weights[0] == 1.0
+        and lat_weights[0] == 1.0
+        and rad_weights[0] == 1.0
+    ):
+        return _gauss_legendre_quadrature_deg2(
+            longitude, cosphi, sinphi, radius, tesseroid, density, glq_nodes, kernel
+        )
     # Get tesseroid boundaries
     w, e, s, n, bottom, top = tesseroid[:]
+    # Precompute the center and half-span of the tesseroid along each
+    # direction (in radians for the angular ones), so scaling each GLQ node
+    # becomes a single multiply-add instead of a call to np.radians
+    lon_center, lon_halfspan = np.radians(0.5 * (e + w)), np.radians(0.5 * (e - w))
+    lat_center, lat_halfspan = np.radians(0.5 * (n + s)), np.radians(0.5 * (n - s))
+    rad_center, rad_halfspan = 0.5 * (top + bottom), 0.5 * (top - bottom)
     # Calculate the A factor for the tesseroid
-    a_factor = 1 / 8 * np.radians(e - w) * np.radians(n - s) * (top - bottom)
-    # Unpack nodes and weights
-    lon_nodes, lat_nodes, rad_nodes = glq_nodes[:]
-    lon_weights, lat_weights, rad_weights = glq_weights[:]
+    a_factor = lon_halfspan * lat_halfspan * rad_halfspan
+    # Precompute the longitude of every point mass: it depends only on the
+    # longitudinal node, so hoist it out of the latitudinal and radial loops
+    longitudes_p = lon_halfspan * lon_nodes + lon_center
     # Compute effect of the tesseroid on the observation point
     # by iterating over the location of the point masses
     # (move the iteration along the longitudinal nodes to the bottom for
@@ -81,17 +111,17 @@ def gauss_legendre_quadrature(
     result = 0.0
     for j, lat_node in enumerate(lat_nodes):
         # Get the latitude of the point mass
-        latitude_p = np.radians(0.5 * (n - s) * lat_node + 0.5 * (n + s))
+        latitude_p = lat_halfspan * lat_node + lat_center
         cosphi_p = np.cos(latitude_p)
         sinphi_p = np.sin(latitude_p)
         for k, rad_node in enumerate(rad_nodes):
             # Get the radius of the point mass
-            radius_p = 0.5 * (top - bottom) * rad_node + 0.5 * (top + bottom)
+            radius_p = rad_halfspan * rad_node + rad_center
             # Get kappa constant for the point mass
             kappa = radius_p**2 * cosphi_p
-            for i, lon_node in enumerate(lon_nodes):
+            for i in range(lon_nodes.size):
                 # Get the longitude of the point mass
-                longitude_p = np.radians(0.5 * (e - w) * lon_node + 0.5 * (e + w))
+                longitude_p = longitudes_p[i]
                 # Compute the mass of the point mass
                 mass = (
                     density
@@ -115,6 +145,67 @@ def gauss_legendre_quadrature(
     return result
 
 
+@jit(nopython=True, fastmath=True)
+def _gauss_legendre_quadrature_deg2(
+    longitude,
+    cosphi,
+    sinphi,
+    radius,
+    tesseroid,
+    density,
+    glq_nodes,
+    kernel,
+):
+    """
+    Specialized GLQ for degree 2 quadratures along every direction.
+
+    Fast path of :func:`gauss_legendre_quadrature` for the default
+    ``(2, 2, 2)`` GLQ degrees. The degree 2 Gauss-Legendre weights are
+    identically one and the two nodes are symmetric around zero, so the eight
+    point masses can be evaluated with unrolled loops, no weight products and
+    a single node offset per direction. Takes the same arguments as
+    :func:`gauss_legendre_quadrature` except for the weights.
+    """
+    # Get tesseroid boundaries
+    w, e, s, n, bottom, top = tesseroid[:]
+    # Precompute the center and half-span of the tesseroid along each
+    # direction (in radians for the angular ones)
+    lon_center, lon_halfspan = np.radians(0.5 * (e + w)), np.radians(0.5 * (e - w))
+    lat_center, lat_halfspan = np.radians(0.5 * (n + s)), np.radians(0.5 * (n - s))
+    rad_center, rad_halfspan = 0.5 * (top + bottom), 0.5 * (top - bottom)
+    # Calculate the A factor for the tesseroid
+    a_factor = lon_halfspan * lat_halfspan * rad_halfspan
+    # Get the offset of each point mass from the tesseroid center along each
+    # direction, using the positive degree 2 node (the second one: leggauss
+    # returns nodes in ascending order)
+    node = glq_nodes[1, 1]
+    lon_offset = lon_halfspan * node
+    lat_offset = lat_halfspan * node
+    rad_offset = rad_halfspan * node
+    # Compute effect of the eight point masses on the observation point
+    # (iterating over two-element tuples gets unrolled by numba)
+    result = 0.0
+    for latitude_p in (lat_center - lat_offset, lat_center + lat_offset):
+        cosphi_p = np.cos(latitude_p)
+        sinphi_p = np.sin(latitude_p)
+        for radius_p in (rad_center - rad_offset, rad_center + rad_offset):
+            # Get the mass of the point mass (weights are equal to one)
+            mass = density * a_factor * radius_p**2 * cosphi_p
+            for longitude_p in (lon_center - lon_offset, lon_center + lon_offset):
+                # Add effect of the current point mass to the result
+                result += mass * kernel(
+                    longitude,
+                    cosphi,
+                    sinphi,
+                    radius,
+                    longitude_p,
+                    cosphi_p,
+                    sinphi_p,
+                    radius_p,
+                )
+    return result
+
+
 def glq_nodes_weights(glq_degrees):
     """
     Calculate GLQ unscaled nodes and weights.
@@ -127,28 +218,41 @@ def glq_nodes_weights(glq_degrees):
 
     Returns
     -------
-    glq_nodes : list
+    glq_nodes : 2d-array
         Unscaled GLQ nodes for each direction: ``longitude``, ``latitude``,
-        ``radius``.
-    glq_weights : list
+        ``radius``, one row per direction.
+    glq_weights : 2d-array
         GLQ weights for each node on each direction: ``longitude``,
-        ``latitude``, ``radius``.
+        ``latitude``, ``radius``, one row per direction.
+
+    Notes
+    -----
+    The nodes and weights are packed into contiguous 2d arrays instead of
+    tuples of arrays: numba doesn't need to unbox a reflected tuple on every
+    call and keeps the row accesses contiguous. When the degrees differ
+    between directions the shorter rows are padded with zero-weight nodes,
+    which add nothing to the quadrature result.
     """
     # Unpack GLQ degrees
     lon_degree, lat_degree, rad_degree = glq_degrees[:]
-    # Get nodes coordinates and weights
-    lon_node, lon_weights = leggauss(lon_degree)
-    lat_node, lat_weights = leggauss(lat_degree)
-    rad_node, rad_weights = leggauss(rad_degree)
-    # Reorder nodes and weights
-    glq_nodes = (lon_node, lat_node, rad_node)
-    glq_weights = (lon_weights, lat_weights, rad_weights)
+    # Get nodes coordinates and weights, packed one direction per row and
+    # padded with zero-weight nodes up to the largest degree
+    max_degree = max(lon_degree, lat_degree, rad_degree)
+    glq_nodes = np.zeros((3, max_degree))
+    glq_weights = np.zeros((3, max_degree))
+    for direction, degree in enumerate((lon_degree, lat_degree, rad_degree)):
+        nodes, weights = leggauss(degree)
+        glq_nodes[direction, :degree] = nodes
+        glq_weights[direction, :degree] = weights
     return glq_nodes, glq_weights
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=True, cache=True)
 def _adaptive_discretization(
-    coordinates,
+    longitude,
+    cosphi,
+    sinphi,
+    radius,
     tesseroid,
     distance_size_ratio,
     stack,
@@ -163,9 +267,14 @@ def _adaptive_discretization(
 
     Parameters
     ----------
-    coordinates : array
-        Array containing ``longitude``, ``latitude`` and ``radius`` of a single
-        computation point.
+    longitude : float
+        Longitudinal coordinate of the computation point in radians.
+    cosphi : float
+        Cosine of the latitudinal coordinate of the computation point.
+    sinphi : float
+        Sine of the latitudinal coordinate of the computation point.
+    radius : float
+        Radial coordinate of the computation point in meters.
     tesseroid : array
         Array containing the boundaries of the tesseroid.
     distance_size_ratio : float
@@ -205,15 +314,18 @@ def _adaptive_discretization(
         # Get its dimensions
         l_lon, l_lat, l_rad = _tesseroid_dimensions(tesseroid)
         # Get distance between computation point and center of tesseroid
-        distance = _distance_tesseroid_point(coordinates, tesseroid)
+        distance = _distance_tesseroid_point_fast(
+            longitude, cosphi, sinphi, radius, tesseroid
+        )
         # Check inequality
-        n_lon, n_lat, n_rad = 1, 1, 1
-        if distance / l_lon < distance_size_ratio:
-            n_lon = 2
-        if distance / l_lat < distance_size_ratio:
-            n_lat = 2
-        if distance / l_rad < distance_size_ratio and radial_discretization:
-            n_rad = 2
+        # (computed branchlessly: the comparisons are data dependent and hard
+        # to predict, so cast the booleans to integers instead of branching,
+        # and compare against distance_size_ratio * l to avoid the divisions)
+        n_lon = 1 + np.int64(distance < distance_size_ratio * l_lon)
+        n_lat = 1 + np.int64(distance < distance_size_ratio * l_lat)
+        n_rad = 1 + np.int64(radial_discretization) * np.int64(
+            distance < distance_size_ratio * l_rad
+        )
         # Apply discretization
         if n_lon * n_lat * n_rad > 1:
             # Raise error if stack overflow
@@ -236,7 +348,127 @@ def _adaptive_discretization(
     return n_splits
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=True)
+def _adaptive_discretization_glq(
+    longitude,
+    cosphi,
+    sinphi,
+    radius,
+    tesseroid,
+    density,
+    distance_size_ratio,
+    stack,
+    radial_discretization,
+    glq_nodes,
+    glq_weights,
+    kernel,
+    glq_function,
+):
+    """
+    Adaptively discretize a tesseroid, streaming the GLQ sums.
+
+    Performs the same traversal as :func:`_adaptive_discretization` but,
+    instead of collecting the small tesseroids in
+    a ``MAX_DISCRETIZATIONS``-sized scratch array, evaluates the quadrature on
+    each small tesseroid as soon as it is produced and accumulates its effect.
+    Only the stack buffer is needed, regardless of how many discretizations
+    take place.
+
+    Parameters
+    ----------
+    longitude : float
+        Longitudinal coordinate of the computation point in radians.
+    cosphi : float
+        Cosine of the latitudinal coordinate of the computation point.
+    sinphi : float
+        Sine of the latitudinal coordinate of the computation point.
+    radius : float
+        Radial coordinate of the computation point in meters.
+    tesseroid : array
+        Array containing the boundaries of the tesseroid.
+    density : float or func
+        Density of the tesseroid in SI units. Passed straight to
+        ``glq_function``, so it must be a float when using
+        :func:`gauss_legendre_quadrature` and a function decorated with
+        :func:`numba.jit` when using the variable density quadrature.
+    distance_size_ratio : float
+        Value for the distance-size ratio. A greater value will perform more
+        discretizations.
+    stack : 2d-array
+        Array with shape ``(6, stack_size)`` that will temporarly hold the
+        small tesseroids that are not yet processed.
+        If too many discretizations will take place, increase the
+        ``stack_size``.
+    radial_discretization : bool
+        If ``True`` the three dimensional adaptive discretization will be
+        applied.
+    glq_nodes : 2d-array
+        Unscaled location of GLQ nodes for each direction, one row per
+        direction.
+    glq_weights : 2d-array
+        GLQ weigths for each node for each direction, one row per direction.
+    kernel : func
+        Kernel function for the gravitational field of point masses.
+    glq_function : func
+        Quadrature function that will be evaluated on each small tesseroid:
+        either :func:`gauss_legendre_quadrature` or
+        :func:`gauss_legendre_quadrature_variable_density`.
+
+    Returns
+    -------
+    result : float
+        Effect of the tesseroid on the computation point.
+    """
+    # Create stack of tesseroids
+    stack[0] = tesseroid
+    stack_top = 0
+    result = 0.0
+    while stack_top >= 0:
+        # Pop the last tesseroid from the stack
+        tesseroid = stack[stack_top]
+        stack_top -= 1
+        # Get its dimensions
+        l_lon, l_lat, l_rad = _tesseroid_dimensions(tesseroid)
+        # Get distance between computation point and center of tesseroid
+        distance = _distance_tesseroid_point_fast(
+            longitude, cosphi, sinphi, radius, tesseroid
+        )
+        # Check inequality
+        # (computed branchlessly: the comparisons are data dependent and hard
+        # to predict, so cast the booleans to integers instead of branching,
+        # and compare against distance_size_ratio * l to avoid the divisions)
+        n_lon = 1 + np.int64(distance < distance_size_ratio * l_lon)
+        n_lat = 1 + np.int64(distance < distance_size_ratio * l_lat)
+        n_rad = 1 + np.int64(radial_discretization) * np.int64(
+            distance < distance_size_ratio * l_rad
+        )
+        # Apply discretization
+        if n_lon * n_lat * n_rad > 1:
+            # Raise error if stack overflow
+            # Number of tesseroids in stack = stack_top + 1
+            if (stack_top + 1) + n_lon * n_lat * n_rad > stack.shape[0]:
+                msg = "Stack Overflow. Try to increase the stack size."
+                raise OverflowError(msg)
+            stack_top = _split_tesseroid(
+                tesseroid, n_lon, n_lat, n_rad, stack, stack_top
+            )
+        else:
+            # Compute the effect of the small tesseroid through GLQ
+            result += glq_function(
+                longitude,
+                cosphi,
+                sinphi,
+                radius,
+                tesseroid,
+                density,
+                glq_nodes,
+                glq_weights,
+                kernel,
+            )
+    return result
+
+
+@jit(nopython=True, fastmath=True, cache=True)
 def _split_tesseroid(tesseroid, n_lon, n_lat, n_rad, stack, stack_top):
     """
     Split tesseroid along each dimension.
@@ -259,23 +491,27 @@ def _split_tesseroid(tesseroid, n_lon, n_lat, n_rad, stack, stack_top):
     return stack_top
 
 
-@jit(nopython=True)
+@jit(nopython=True, fastmath=True, cache=True)
 def _tesseroid_dimensions(tesseroid):
     """
     Calculate the dimensions of the tesseroid.
+
+    The latitudinal arc spans exactly the ``n - s`` angle, while the
+    longitudinal one is obtained through a haversine formulation: unlike the
+    cosine-law ``arccos`` expression, it stays numerically stable for the
+    small angular distances produced by deep adaptive discretizations and
+    needs fewer trigonometric evaluations.
     """
     w, e, s, n, bottom, top = tesseroid[:]
     w, e, s, n = np.radians(w), np.radians(e), np.radians(s), np.radians(n)
     latitude_center = (n + s) / 2
-    l_lat = top * np.arccos(np.sin(n) * np.sin(s) + np.cos(n) * np.cos(s))
-    l_lon = top * np.arccos(
-        np.sin(latitude_center) ** 2 + np.cos(latitude_center) ** 2 * np.cos(e - w)
-    )
+    l_lat = top * (n - s)
+    l_lon = top * 2 * np.arcsin(np.cos(latitude_center) * np.sin((e - w) / 2))
     l_rad = top - bottom
     return l_lon, l_lat, l_rad
 
 
-@jit(nopython=True)
+@jit(nopython=True, cache=True)
 def _distance_tesseroid_point(coordinates, tesseroid):
     """
     Distance between a computation point and the center of a tesseroid.
@@ -290,6 +526,49 @@ def _distance_tesseroid_point(coordinates, tesseroid):
     return distance
 
 
+@jit(nopython=True, fastmath=True, cache=True)
+def _distance_tesseroid_point_fast(longitude, cosphi, sinphi, radius, tesseroid):
+    """
+    Distance between a computation point and the center of a tesseroid.
+
+    Variant of :func:`_distance_tesseroid_point` that takes precomputed
+    trigonometric quantities for the computation point (its longitude in
+    radians along with the cosine and sine of its latitude), avoiding the
+    redundant conversions and trigonometric evaluations carried out by
+    :func:`harmonica._forward.utils.distance_spherical`.
+    """
+    # Get center of the tesseroid
+    w, e, s, n, bottom, top = tesseroid[:]
+    longitude_p = np.radians((w + e) / 2)
+    latitude_p = np.radians((s + n) / 2)
+    radius_p = (bottom + top) / 2
+    # Compute trigonometric quantities for the tesseroid center
+    cosphi_p = np.cos(latitude_p)
+    sinphi_p = np.sin(latitude_p)
+    # Get distance between computation point and tesseroid center
+    distance, _, _ = distance_spherical_core(
+        longitude, cosphi, sinphi, radius, longitude_p, cosphi_p, sinphi_p, radius_p
+    )
+    return distance
+
+
+def _format_invalid_tesseroids(invalid_tesseroids, max_reported=20):
+    """
+    Format a capped listing of invalid tesseroids for error messages.
+
+    Builds the listing with a single join and reports at most
+    ``max_reported`` offending tesseroids: formatting thousands of rows would
+    dominate the error path without making the message more useful.
+    """
+    lines = [
+        f"\tInvalid tesseroid: {tess}\n" for tess in invalid_tesseroids[:max_reported]
+    ]
+    n_remaining = len(invalid_tesseroids) - max_reported
+    if n_remaining > 0:
+        lines.append(f"\t... and {n_remaining} more invalid tesseroid(s)\n")
+    return "".join(lines)
+
+
 def _check_tesseroids(tesseroids):
     """
     Check if tesseroids boundaries are well defined.
@@ -327,68 +606,58 @@ def _check_tesseroids(tesseroids):
         the same one as the orignal.
         Otherwise, it's copied and its longitudinal boundaries are modified.
     """
-    west, east, south, north, bottom, top = tuple(tesseroids[:, i] for i in range(6))
+    west, east, south, north, bottom, top = _boundaries_to_soa(tesseroids)
     err_msg = "Invalid tesseroid or tesseroids. "
     # Check if latitudinal boundaries are inside the [-90, 90] interval
-    invalid = np.logical_or(
-        np.logical_or(south < -90, south > 90), np.logical_or(north < -90, north > 90)
-    )
+    # (fuse the comparisons with | to avoid the intermediate arrays that
+    # nesting np.logical_or would allocate)
+    invalid = (south < -90) | (south > 90) | (north < -90) | (north > 90)
     if (invalid).any():
         err_msg += (
             "The latitudinal boundaries must be inside the [-90, 90] "
             + "degrees interval.\n"
         )
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Check if south boundary is not greater than the corresponding north
     # boundary
     invalid = south > north
     if (invalid).any():
         err_msg += "The south boundary can't be greater than the north one.\n"
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Check if radial boundaries are positive or zero
-    invalid = np.logical_or(bottom < 0, top < 0)
+    invalid = (bottom < 0) | (top < 0)
     if (invalid).any():
         err_msg += "The bottom and top radii should be positive or zero.\n"
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Check if top boundary is not greater than the corresponding bottom
     # boundary
     invalid = bottom > top
     if (invalid).any():
         err_msg += "The bottom radius boundary can't be greater than the top one.\n"
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Check if longitudinal boundaries are inside the [-180, 360] interval
-    invalid = np.logical_or(
-        np.logical_or(west < -180, west > 360), np.logical_or(east < -180, east > 360)
-    )
+    invalid = (west < -180) | (west > 360) | (east < -180) | (east > 360)
     if (invalid).any():
         err_msg += (
             "The longitudinal boundaries must be inside the [-180, 360] "
             + "degrees interval.\n"
         )
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Apply longitude continuity if w > e
     if (west > east).any():
         tesseroids = _longitude_continuity(tesseroids)
-        west, east, south, north, bottom, top = tuple(
-            tesseroids[:, i] for i in range(6)
-        )
+        west, east, south, north, bottom, top = _boundaries_to_soa(tesseroids)
     # Check if west boundary is not greater than the corresponding east
     # boundary, even after applying the longitude continuity
     invalid = west > east
     if (invalid).any():
         err_msg += "The west boundary can't be greater than the east one.\n"
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     # Check if the longitudinal interval is not grater than one turn around the
     # globe
@@ -398,12 +667,23 @@ def _check_tesseroids(tesseroids):
             "The difference between east and west boundaries cannot be greater than "
             + "one turn around the globe.\n"
         )
-        for tess in tesseroids[invalid]:
-            err_msg += f"\tInvalid tesseroid: {tess}\n"
+        err_msg += _format_invalid_tesseroids(tesseroids[invalid])
         raise ValueError(err_msg)
     return tesseroids
 
 
+def _boundaries_to_soa(tesseroids):
+    """
+    Extract the tesseroid boundaries as contiguous 1d arrays.
+
+    Returns a structure-of-arrays version of the ``(n_tesseroids, 6)``
+    boundaries array: one contiguous array per boundary (``w``, ``e``, ``s``,
+    ``n``, ``bottom``, ``top``), so the bulk comparisons in the sanity checks
+    run on stride-1 data instead of strided column views.
+    """
+    return tuple(np.ascontiguousarray(tesseroids[:, i]) for i in range(6))
+
+
 def check_points_outside_tesseroids(coordinates, tesseroids):
     """
     Check if computation points are not inside the tesseroids.
@@ -432,41 +712,129 @@ def check_points_outside_tesseroids(coordinates, tesseroids):
         If any computation point falls inside any tesseroid.
     """
     longitude, latitude, radius = coordinates
-    conflicting = _check_points_outside_tesseroids(coordinates, tesseroids)
-    if conflicting:
-        err_msg = (
+    # Discard tesseroids that cannot contain any point because they don't
+    # overlap the latitudinal and radial bounding box of the computation
+    # points: these are cheap 1d comparisons that typically leave only a few
+    # candidates for the per-pair check (the longitudinal boundaries are left
+    # out since they would need the dual [0, 360) and [-180, 180) treatment)
+    lat_min, lat_max = np.min(latitude), np.max(latitude)
+    rad_min, rad_max = np.min(radius), np.max(radius)
+    _, _, south, north, bottom, top = _boundaries_to_soa(tesseroids)
+    candidates = (south < lat_max) & (north > lat_min) & (bottom < rad_max)
+    candidates &= top > rad_min
+    if not candidates.any():
+        return
+    tesseroids = tesseroids[candidates]
+    # Sort the candidates by their southern boundary: a binary search can
+    # then limit the containment loop for each point to the tesseroids that
+    # start south of it, playing the role of a spatial index without adding
+    # a dependency
+    tesseroids = tesseroids[np.argsort(tesseroids[:, 2])]
+    # Unpack the boundaries into contiguous per-boundary arrays and
+    # precompute the longitudinal span of every tesseroid once: the per-pair
+    # containment test then needs a single subtract, modulo and compare for
+    # the longitude
+    west, east, south, north, bottom, top = _boundaries_to_soa(tesseroids)
+    lon_span = east - west
+    boundaries = (west, lon_span, south, north, bottom, top)
+    # Screen for conflicting points with a parallel pass that only counts
+    # them: the expensive pair collection for the error message runs only on
+    # the rare occasion that a point falls inside a tesseroid
+    n_conflicting = _any_point_inside_tesseroids(coordinates, boundaries)
+    if not n_conflicting:
+        return
+    # Collect and report only the first few conflicting pairs: formatting
+    # millions of them would dwarf the check itself, and a handful is enough
+    # to diagnose the model
+    max_reported = 10
+    conflicting = _check_points_outside_tesseroids(
+        coordinates, boundaries, max_reported
+    )
+    err_msg = [
+        (
             "Found computation point(s) inside tesseroid(s). "
             "Computation points must be outside of tesseroids.\n"
         )
-        for i, j in conflicting:
-            west, east, south, north, bottom, top = tesseroids[j, :]
-            err_msg += (
-                f" - Computation point '({longitude[i]}, {latitude[i]}, {radius[i]})' "
-                "inside tesseroid "
-                f"'({west}, {east}, {south}, {north}, {bottom}, {top})'.\n"
-            )
-        raise ValueError(err_msg)
+    ]
+    for i, j in conflicting:
+        west, east, south, north, bottom, top = tesseroids[j, :]
+        err_msg.append(
+            f" - Computation point '({longitude[i]}, {latitude[i]}, {radius[i]})' "
+            "inside tesseroid "
+            f"'({west}, {east}, {south}, {north}, {bottom}, {top})'.\n"
+        )
+    # The collector stops between points, so every point index it returns has
+    # all of its pairs reported: compare the distinct points shown against
+    # the point count from the screening pass to size the remainder
+    points_shown = len({i for i, _ in conflicting})
+    if n_conflicting > points_shown:
+        err_msg.append(
+            f" - ... and {n_conflicting - points_shown} more computation "
+            "point(s) inside tesseroid(s).\n"
+        )
+    raise ValueError("".join(err_msg))
 
 
-@jit(nopython=True)
-def _check_points_outside_tesseroids(coordinates, tesseroids):
+@jit(nopython=True, parallel=True, cache=True)
+def _any_point_inside_tesseroids(coordinates, boundaries):
+    """
+    Count the observation points that fall inside some tesseroid.
+
+    Parallel screening pass for ``check_points_outside_tesseroids``: it only
+    counts the conflicting points (at most one per point, breaking out of the
+    tesseroid loop on the first hit) so the outer loop can run as a prange
+    with a scalar reduction. ``boundaries`` must contain the ``west``,
+    ``lon_span``, ``south``, ``north``, ``bottom`` and ``top`` arrays of the
+    tesseroids, sorted by their southern boundary.
     """
-    Check if observation points fall inside tesseroids.
+    longitude, latitude, radius = coordinates[:]
+    west, lon_span, south, north, bottom, top = boundaries[:]
+    n_inside = 0
+    for i in prange(longitude.size):
+        # Only the tesseroids that start south of the point can contain it
+        # (the binary search also guarantees south[j] < latitude[i] for every
+        # j below the returned index)
+        for j in range(np.searchsorted(south, latitude[i])):
+            # The longitudinal test measures the angle from the west boundary
+            # to the point modulo a full turn: a single comparison handles
+            # both the [0, 360) and [-180, 180) conventions at once
+            if (
+                latitude[i] < north[j]
+                and bottom[j] < radius[i] < top[j]
+                and 0 < (longitude[i] - west[j]) % 360 < lon_span[j]
+            ):
+                n_inside += 1
+                break
+    return n_inside
+
+
+@jit(nopython=True, cache=True)
+def _check_points_outside_tesseroids(coordinates, boundaries, max_pairs):
+    """
+    Collect observation point and tesseroid pairs in conflict.
+
+    Returns at most ``max_pairs`` conflicting ``(point, tesseroid)`` index
+    pairs. ``boundaries`` must contain the ``west``, ``lon_span``, ``south``,
+    ``north``, ``bottom`` and ``top`` arrays of the tesseroids, sorted by
+    their southern boundary.
     """
     longitude, latitude, radius = coordinates[:]
+    west, lon_span, south, north, bottom, top = boundaries[:]
     conflicting = []
     for i in range(longitude.size):
-        for j in range(tesseroids.shape[0]):
-            # Longitudinal boundaries of the tesseroid must be compared with
-            # longitudinal coordinates of computation points when moved to
-            # [0, 360) and [-180, 180).
-            longitude_360 = longitude[i] % 360
-            longitude_180 = ((longitude[i] + 180) % 360) - 180
-            west, east, south, north, bottom, top = tesseroids[j, :]
+        if len(conflicting) >= max_pairs:
+            break
+        # Only the tesseroids that start south of the point can contain it
+        # (the binary search also guarantees south[j] < latitude[i] for every
+        # j below the returned index)
+        for j in range(np.searchsorted(south, latitude[i])):
+            # The longitudinal test measures the angle from the west boundary
+            # to the point modulo a full turn: a single comparison handles
+            # both the [0, 360) and [-180, 180) conventions at once
             if (
-                (west < longitude_180 < east or west < longitude_360 < east)
-                and south < latitude[i] < north
-                and bottom < radius[i] < top
+                latitude[i] < north[j]
+                and bottom[j] < radius[i] < top[j]
+                and 0 < (longitude[i] - west[j]) % 360 < lon_span[j]
             ):
                 conflicting.append((i, j))
     return conflicting
@@ -495,12 +863,19 @@ def _longitude_continuity(tesseroids):
     tesseroids : 2d-array
         Modified boundaries of the tesseroids.
     """
+    tess_to_be_changed = tesseroids[:, 0] > tesseroids[:, 1]
+    # Return the original array untouched if no boundary needs to be moved
+    if not tess_to_be_changed.any():
+        return tesseroids
     # Copy the tesseroids to avoid modifying the original tesseroids array
     tesseroids = tesseroids.copy()
-    west, east = tesseroids[:, 0], tesseroids[:, 1]
-    tess_to_be_changed = west > east
-    east[tess_to_be_changed] = ((east[tess_to_be_changed] + 180) % 360) - 180
-    west[tess_to_be_changed] = ((west[tess_to_be_changed] + 180) % 360) - 180
+    # Apply the wrap in place on the masked rows only: the where= argument of
+    # the ufuncs avoids the gather/scatter and the temporary arrays that
+    # boolean fancy indexing would allocate
+    for boundary in (tesseroids[:, 0], tesseroids[:, 1]):
+        np.add(boundary, 180, out=boundary, where=tess_to_be_changed)
+        np.mod(boundary, 360, out=boundary, where=tess_to_be_changed)
+        np.subtract(boundary, 180, out=boundary, where=tess_to_be_changed)
     return tesseroids
 
 
@@ -10,12 +10,15 @@ Utils functions for tesseroids with variable density.
 
 import numpy as np
 from numba import jit
-from scipy.optimize import minimize_scalar
+from numba.core.dispatcher import Dispatcher
 
 DELTA_RATIO = 0.1
 
+# Inverse of the golden ratio, used by the golden-section searches
+GOLDEN_RATIO_INV = (np.sqrt(5) - 1) / 2
 
-@jit(nopython=True)
+
+@jit(nopython=True, fastmath=True)
 def gauss_legendre_quadrature_variable_density(
     longitude,
     cosphi,
@@ -58,21 +61,35 @@ def gauss_legendre_quadrature_variable_density(
         meters.
     density : func
         Density func of the tesseroid in SI units.
-    glq_nodes : list
-        Unscaled location of GLQ nodes for each direction.
-    glq_weights : list
-        GLQ weigths for each node for each direction.
+    glq_nodes : 2d-array
+        Unscaled location of GLQ nodes for each direction, one row per
+        direction.
+    glq_weights : 2d-array
+        GLQ weigths for each node for each direction, one row per direction.
     kernel : func
         Kernel function for the gravitational field of point masses.
 
     """
     # Get tesseroid boundaries
     w, e, s, n, bottom, top = tesseroid[:]
+    # Precompute the center and half-span of the tesseroid along each
+    # direction (in radians for the angular ones), so scaling each GLQ node
+    # becomes a single multiply-add instead of a call to np.radians
+    lon_center, lon_halfspan = np.radians(0.5 * (e + w)), np.radians(0.5 * (e - w))
+    lat_center, lat_halfspan = np.radians(0.5 * (n + s)), np.radians(0.5 * (n - s))
+    rad_center, rad_halfspan = 0.5 * (top + bottom), 0.5 * (top - bottom)
     # Calculate the A factor for the tesseroid
-    a_factor = 1 / 8 * np.radians(e - w) * np.radians(n - s) * (top - bottom)
+    a_factor = lon_halfspan * lat_halfspan * rad_halfspan
     # Unpack nodes and weights
-    lon_nodes, lat_nodes, rad_nodes = glq_nodes[:]
-    lon_weights, lat_weights, rad_weights = glq_weights[:]
+    lon_nodes, lat_nodes, rad_nodes = glq_nodes[0], glq_nodes[1], glq_nodes[2]
+    lon_weights, lat_weights, rad_weights = (
+        glq_weights[0],
+        glq_weights[1],
+        glq_weights[2],
+    )
+    # Precompute the longitude of every point mass: it depends only on the
+    # longitudinal node, so hoist it out of the latitudinal and radial loops
+    longitudes_p = lon_halfspan * lon_nodes + lon_center
     # Compute effect of the tesseroid on the observation point
     # by iterating over the location of the point masses
     # (move the iteration along the longitudinal nodes to the bottom for
@@ -81,18 +98,18 @@ def gauss_legendre_quadrature_variable_density(
     result = 0.0
     for j, lat_node in enumerate(lat_nodes):
         # Get the latitude of the point mass
-        latitude_p = np.radians(0.5 * (n - s) * lat_node + 0.5 * (n + s))
+        latitude_p = lat_halfspan * lat_node + lat_center
         cosphi_p = np.cos(latitude_p)
         sinphi_p = np.sin(latitude_p)
         for k, rad_node in enumerate(rad_nodes):
             # Get the radius of the point mass
-            radius_p = 0.5 * (top - bottom) * rad_node + 0.5 * (top + bottom)
+            radius_p = rad_halfspan * rad_node + rad_center
             density_p = density(radius_p)
             # Get kappa constant for the point mass
             kappa = radius_p**2 * cosphi_p
-            for i, lon_node in enumerate(lon_nodes):
+            for i in range(lon_nodes.size):
                 # Get the longitude of the point mass
-                longitude_p = np.radians(0.5 * (e - w) * lon_node + 0.5 * (e + w))
+                longitude_p = longitudes_p[i]
                 # Compute the mass of the point mass
                 mass = (
                     density_p
@@ -139,13 +156,19 @@ def density_based_discretization(tesseroids, density):
         Array containing the coordinates of radially discretized tesseriods.
         Each row of the array will have the boundaries for each new tesseroid.
     """
-    discretized_tesseroids = []
+    # Preallocate the output array and write the discretized tesseroids
+    # directly into its rows: this avoids growing Python lists of lists and
+    # the final copy that np.atleast_2d would make out of them
+    discretized_tesseroids = np.empty((len(tesseroids) * 4, 6))
+    count = 0
     for tesseroid in tesseroids:
-        discretized_tesseroids.extend(_density_based_discretization(tesseroid, density))
-    return np.atleast_2d(discretized_tesseroids)
+        discretized_tesseroids, count = _density_based_discretization(
+            tesseroid, density, discretized_tesseroids, count
+        )
+    return discretized_tesseroids[:count]
 
 
-def _density_based_discretization(tesseroid, density):
+def _density_based_discretization(tesseroid, density, out, count):
     """
     Apply density-based discretization to a single tesseroid.
 
@@ -160,66 +183,125 @@ def _density_based_discretization(tesseroid, density):
         meters.
     density : func
         Density func of the tesseroid in SI units.
+    out : 2d-array
+        Array where the boundaries of the discretized tesseroids will be
+        written, one per row, starting on the row given by ``count``.
+    count : int
+        Number of rows of ``out`` that are already in use.
 
     Returns
     -------
-    tesseroids : list
-        List containing the boundaries of discretized tesseroids.
+    out : 2d-array
+        The output array, possibly reallocated to make room for new rows.
+    count : int
+        Updated number of rows of ``out`` that are in use.
     """
-
-    # Define normalized density
-    def normalized_density(radius):
-        return (density(radius) - density_min) / (density_max - density_min)
-
     # Get boundaries of original tesseroid
     w, e, s, n, bottom, top = tesseroid[:]
     # Get minimum and maximum values of the density
     density_min, density_max = density_minmax(density, bottom, top)
     # Return the original tesseroid if max and min densities are equal
     if np.isclose(density_min, density_max):
-        return [tesseroid]
+        return _append_tesseroid(out, count, w, e, s, n, bottom, top)
     # Store the size of the original tesseroid
     size_original_tesseroid = top - bottom
-    # Initialize list of pending and output tesseroids
-    pending, tesseroids = [tesseroid], []
+    # Initialize list of pending radial boundaries
+    pending = [(bottom, top)]
     # Discretization of the tesseroid
+    # (process the pending list as a LIFO stack: list.pop() is O(1) while
+    # list.pop(0) shifts every remaining element, and the traversal order
+    # doesn't affect the resulting set of tesseroids)
     while pending:
-        tesseroid = pending.pop(0)
-        bottom, top = tesseroid[-2:]
-        radius_split, max_diff = maximum_absolute_diff(normalized_density, bottom, top)
+        bottom, top = pending.pop()
+        # Search over the raw density and normalize the difference afterwards:
+        # the straight line joins the density values on the boundaries, so the
+        # normalization is a pure scaling that doesn't move the maximum
+        radius_split, max_diff = maximum_absolute_diff(density, bottom, top)
+        max_diff /= density_max - density_min
         size_ratio = (top - bottom) / size_original_tesseroid
         if max_diff * size_ratio > DELTA_RATIO:
-            pending.append([w, e, s, n, radius_split, top])
-            pending.append([w, e, s, n, bottom, radius_split])
+            pending.append((bottom, radius_split))
+            pending.append((radius_split, top))
         else:
-            tesseroids.append([w, e, s, n, bottom, top])
-    return tesseroids
+            out, count = _append_tesseroid(out, count, w, e, s, n, bottom, top)
+    return out, count
+
+
+def _append_tesseroid(out, count, w, e, s, n, bottom, top):
+    """
+    Write a tesseroid on the next free row of the output array.
+
+    Doubles the size of the array when it runs out of free rows.
+    """
+    if count == out.shape[0]:
+        out = np.resize(out, (2 * out.shape[0], 6))
+    out[count] = w, e, s, n, bottom, top
+    return out, count + 1
 
 
 def density_minmax(density, bottom, top):
     """
     Compute the minimum and maximum value of a bounded density.
     """
+    # Run the searches in compiled mode when the density function is a numba
+    # dispatcher, falling back to the pure Python implementation otherwise
+    if isinstance(density, Dispatcher):
+        minimize = _golden_section_minimize
+    else:
+        minimize = getattr(
+            _golden_section_minimize, "py_func", _golden_section_minimize
+        )
     # Calculate min and max density values at the top and bottom boundaries
     density_bounds_min, density_bounds_max = np.sort([density(bottom), density(top)])
-    # Estimate the minimum value of the density function withing bounds
-    kwargs = {"bounds": [bottom, top], "method": "bounded"}
-    minimum = np.min(
-        (
-            minimize_scalar(density, **kwargs).fun,
-            density_bounds_min,
-        )
-    )
-    # Estimate the maximum value of the density function withing bounds
-    maximum = np.max(
-        (
-            -minimize_scalar(lambda radius: -density(radius), **kwargs).fun,
-            density_bounds_max,
-        )
-    )
+    # Estimate the minimum and maximum values of the density function within
+    # bounds
+    _, density_interior_min = minimize(density, bottom, top, 1.0)
+    _, density_interior_max = minimize(density, bottom, top, -1.0)
+    minimum = np.min((density_interior_min, density_bounds_min))
+    maximum = np.max((density_interior_max, density_bounds_max))
     return minimum, maximum
 
 
+@jit(nopython=True)
+def _golden_section_minimize(func, lower, upper, sign):
+    """
+    Minimize ``sign * func`` within bounds through a golden-section search.
+
+    Parameters
+    ----------
+    func : func
+        Function to be minimized. Must be decorated with :func:`numba.jit`.
+        Pass ``sign=-1.0`` to maximize it instead.
+    lower, upper : floats
+        Boundaries of the search interval.
+    sign : float
+        Either ``1.0`` (minimization) or ``-1.0`` (maximization).
+
+    Returns
+    -------
+    x_best : float
+        Location of the estimated extremum.
+    f_best : float
+        Value of ``func`` (without the ``sign`` factor) on ``x_best``.
+    """
+    tolerance = 1e-8 * (upper - lower)
+    x_1 = upper - GOLDEN_RATIO_INV * (upper - lower)
+    x_2 = lower + GOLDEN_RATIO_INV * (upper - lower)
+    f_1 = sign * func(x_1)
+    f_2 = sign * func(x_2)
+    while upper - lower > tolerance:
+        if f_1 < f_2:
+            upper, x_2, f_2 = x_2, x_1, f_1
+            x_1 = upper - GOLDEN_RATIO_INV * (upper - lower)
+            f_1 = sign * func(x_1)
+        else:
+            lower, x_1, f_1 = x_1, x_2, f_2
+            x_2 = lower + GOLDEN_RATIO_INV * (upper - lower)
+            f_2 = sign * func(x_2)
+    x_best = 0.5 * (lower + upper)
+    return x_best, func(x_best)
+
+
 def maximum_absolute_diff(normalized_density, bottom, top):
     """
     Compute maximum abs difference between normalized density and straight line.
@@ -227,25 +309,52 @@ def maximum_absolute_diff(normalized_density, bottom, top):
     The maximum difference is computed within the ``bottom`` and ``top``
     boundaries.
     """
+    # Run the search in compiled mode when the density function is a numba
+    # dispatcher, falling back to the pure Python implementation otherwise
+    if isinstance(normalized_density, Dispatcher):
+        search = _maximum_absolute_diff
+    else:
+        search = getattr(_maximum_absolute_diff, "py_func", _maximum_absolute_diff)
+    return search(normalized_density, bottom, top)
 
-    def neg_absolute_difference(radius):
-        """
-        Define minus absolute diff between normalized density and straight line.
-        """
-        return -np.abs(
-            normalized_density(radius)
-            - straight_line(radius, normalized_density, bottom, top)
-        )
 
-    # Use scipy.optimize.minimize_scalar for maximizing the absolute difference
-    result = minimize_scalar(
-        neg_absolute_difference,
-        bounds=[bottom, top],
-        method="bounded",
+@jit(nopython=True)
+def _maximum_absolute_diff(normalized_density, bottom, top):
+    """
+    Golden-section search for the maximum absolute difference.
+
+    Maximizes the absolute difference between the density function and the
+    straight line that joins its values on the ``bottom`` and ``top``
+    boundaries.
+    """
+    # Compute the straight line that joins the boundary density values once
+    density_bottom = normalized_density(bottom)
+    slope = (normalized_density(top) - density_bottom) / (top - bottom)
+    # Maximize the absolute difference through a golden-section search
+    tolerance = 1e-8 * (top - bottom)
+    lower, upper = bottom, top
+    x_1 = upper - GOLDEN_RATIO_INV * (upper - lower)
+    x_2 = lower + GOLDEN_RATIO_INV * (upper - lower)
+    f_1 = np.abs(normalized_density(x_1) - (slope * (x_1 - bottom) + density_bottom))
+    f_2 = np.abs(normalized_density(x_2) - (slope * (x_2 - bottom) + density_bottom))
+    while upper - lower > tolerance:
+        if f_1 > f_2:
+            upper, x_2, f_2 = x_2, x_1, f_1
+            x_1 = upper - GOLDEN_RATIO_INV * (upper - lower)
+            f_1 = np.abs(
+                normalized_density(x_1) - (slope * (x_1 - bottom) + density_bottom)
+            )
+        else:
+            lower, x_1, f_1 = x_1, x_2, f_2
+            x_2 = lower + GOLDEN_RATIO_INV * (upper - lower)
+            f_2 = np.abs(
+                normalized_density(x_2) - (slope * (x_2 - bottom) + density_bottom)
+            )
+    radius_split = 0.5 * (lower + upper)
+    max_diff = np.abs(
+        normalized_density(radius_split)
+        - (slope * (radius_split - bottom) + density_bottom)
     )
-    # Get maximum difference and the radius at which it takes place
-    radius_split = result.x
-    max_diff = -result.fun
     return radius_split, max_diff
 
 
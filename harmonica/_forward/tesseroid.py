@@ -9,12 +9,14 @@ Forward modelling for tesseroids.
 """
 
 import numpy as np
-from numba import jit, prange
+from numba import get_num_threads, get_thread_id, jit, prange
 
 from ._tesseroid_utils import (
-    _adaptive_discretization,
+    _adaptive_discretization_glq,
     _check_tesseroids,
     _discard_null_tesseroids,
+    _distance_tesseroid_point_fast,
+    _tesseroid_dimensions,
     check_points_outside_tesseroids,
     gauss_legendre_quadrature,
     glq_nodes_weights,
@@ -99,8 +101,17 @@ def tesseroid_gravity(
         discretization, splitting the tesseroids on every direction.
         Default ``False``.
     dtype : data-type (optional)
-        Data type assigned to the resulting gravitational field. Default to
-        ``np.float64``.
+        Data type assigned to the resulting gravitational field, and to which
+        the coordinates, tesseroids and densities will be converted before the
+        computations. Default to ``np.float64``.
+        Passing ``np.float32`` halves the memory bandwidth of the forward
+        model and doubles the available SIMD lanes at the cost of a less
+        accurate result. Since the accuracy of the tesseroid model is usually
+        limited by the quadrature and the adaptive discretization rather than
+        by the floating point precision, single precision is often a viable
+        tradeoff for computation points far away from the sources. Be aware
+        that the source-point distances suffer from cancellation in single
+        precision, so expect large errors on points close to the tesseroids.
     progressbar : bool (optional)
         If True, a progress bar of the computation will be printed to standard
         error (stderr). Requires :mod:`numba_progress` to be installed.
@@ -166,8 +177,12 @@ def tesseroid_gravity(
     # Figure out the shape and size of the output array
     cast = np.broadcast(*coordinates[:3])
     result = np.zeros(cast.size, dtype=dtype)
-    # Convert coordinates, tesseroids and density to arrays
-    coordinates = tuple(np.atleast_1d(i).ravel() for i in coordinates[:3])
+    # Broadcast and convert coordinates and tesseroids to contiguous arrays of
+    # the desired dtype
+    coordinates = tuple(
+        np.ascontiguousarray(np.atleast_1d(i), dtype=dtype).ravel()
+        for i in np.broadcast_arrays(*coordinates[:3])
+    )
     tesseroids = np.atleast_2d(tesseroids)
     # Sanity checks for tesseroids and computation points
     if not disable_checks:
@@ -186,12 +201,19 @@ def tesseroid_gravity(
             )
         # Discard null tesseroids (zero density or zero volume)
         tesseroids, density = _discard_null_tesseroids(tesseroids, density)
+    # Convert tesseroids and density to contiguous arrays of the desired dtype
+    tesseroids = np.ascontiguousarray(tesseroids, dtype=dtype)
+    if not callable(density):
+        density = np.ascontiguousarray(density, dtype=dtype)
     # Get GLQ unscaled nodes, weights and number of nodes for each small
     # tesseroid
     glq_nodes, glq_weights = glq_nodes_weights(GLQ_DEGREES)
     # Compute gravitational field
     with initialize_progressbar(coordinates[0].size, progressbar) as progress_proxy:
-        dispatcher(parallel, density)(
+        forward_function = dispatcher(
+            parallel, density, coordinates[0].size, tesseroids.shape[0]
+        )
+        forward_function(
             coordinates,
             tesseroids,
             density,
@@ -213,23 +235,34 @@ def tesseroid_gravity(
     return result.reshape(cast.shape)
 
 
-def dispatcher(parallel, density):
+def dispatcher(parallel, density, n_observations, n_tesseroids):
     """
     Return the jitted compiled forward modelling function.
 
     The choice of the forward modelling function is based on whether the
-    density is a function and if the model should be run in parallel.
+    density is a function, if the model should be run in parallel and on the
+    ratio between the number of observation points and tesseroids.
     """
     if callable(density):
         dispatchers = {
             True: jit_tesseroid_gravity_variable_density_parallel,
             False: jit_tesseroid_gravity_variable_density_serial,
         }
-    else:
-        dispatchers = {
-            True: jit_tesseroid_gravity_parallel,
-            False: jit_tesseroid_gravity_serial,
-        }
+        return dispatchers[parallel]
+    # Parallelizing over the observation points wastes most of the threads
+    # when there are only a handful of them (e.g. a terrain correction on
+    # a single station). In that case pivot the parallel loop to run over the
+    # tesseroids instead, as long as there are enough of them to share.
+    if (
+        parallel
+        and n_observations < get_num_threads() * 4
+        and n_tesseroids > n_observations
+    ):
+        return jit_tesseroid_gravity_over_tesseroids_parallel
+    dispatchers = {
+        True: jit_tesseroid_gravity_parallel,
+        False: jit_tesseroid_gravity_serial,
+    }
     return dispatchers[parallel]
 
 
@@ -282,10 +315,10 @@ def jit_tesseroid_gravity(
         tesseroid only on the horizontal direction.
         If ``True``, it will perform a three dimensional adaptive
         discretization, splitting the tesseroids on every direction.
-    glq_nodes : list
-        List containing unscaled GLQ nodes.
-    glq_weights : list
-        List containing GLQ weights of the nodes.
+    glq_nodes : 2d-array
+        Array containing unscaled GLQ nodes, one row per direction.
+    glq_weights : 2d-array
+        Array containing GLQ weights of the nodes, one row per direction.
     kernel : func
         Kernel function for the gravitational field of point masses.
     dtype : data-type
@@ -301,36 +334,70 @@ def jit_tesseroid_gravity(
     longitude_rad = np.radians(longitude)
     cosphi = np.cos(np.radians(latitude))
     sinphi = np.sin(np.radians(latitude))
+    # Precompute the dimensions of every tesseroid: they are shared by all
+    # computation points and let us skip the discretization machinery for
+    # tesseroids that are far enough from the observer
+    n_tesseroids = tesseroids.shape[0]
+    dimensions = np.empty((n_tesseroids, 3), dtype=dtype)
+    for j in range(n_tesseroids):
+        l_lon, l_lat, l_rad = _tesseroid_dimensions(tesseroids[j, :])
+        dimensions[j, 0] = l_lon
+        dimensions[j, 1] = l_lat
+        dimensions[j, 2] = l_rad
+    # Allocate the stack scratch buffer once per thread: every computation
+    # point handled by a thread reuses the same memory instead of allocating
+    # fresh arrays on each iteration
+    stack = np.empty((get_num_threads(), STACK_SIZE, 6), dtype=dtype)
     # Loop over computation points
     for i in prange(longitude.size):
-        # Initialize arrays to perform memory allocation only once
-        stack = np.empty((STACK_SIZE, 6), dtype=dtype)
-        small_tesseroids = np.empty((MAX_DISCRETIZATIONS, 6), dtype=dtype)
+        thread_id = get_thread_id()
         # Loop over tesseroids
         for j in range(tesseroids.shape[0]):
-            # Apply adaptive discretization on tesseroid
-            n_splits = _adaptive_discretization(
-                (longitude[i], latitude[i], radius[i]),
-                tesseroids[j, :],
-                distance_size_ratio,
-                stack,
-                small_tesseroids,
-                radial_adaptive_discretization,
+            # Skip the adaptive discretization when the tesseroid is far
+            # enough that no splitting would take place: the cached
+            # dimensions make this a cheap distance check and the quadrature
+            # can run directly on the whole tesseroid
+            distance = _distance_tesseroid_point_fast(
+                longitude_rad[i], cosphi[i], sinphi[i], radius[i], tesseroids[j, :]
             )
-            # Compute effect of the tesseroid through GLQ
-            for tess_index in range(n_splits):
-                tesseroid = small_tesseroids[tess_index, :]
+            no_split = (
+                distance / dimensions[j, 0] >= distance_size_ratio
+                and distance / dimensions[j, 1] >= distance_size_ratio
+                and (
+                    not radial_adaptive_discretization
+                    or distance / dimensions[j, 2] >= distance_size_ratio
+                )
+            )
+            if no_split:
                 result[i] += gauss_legendre_quadrature(
                     longitude_rad[i],
                     cosphi[i],
                     sinphi[i],
                     radius[i],
-                    tesseroid,
+                    tesseroids[j, :],
                     density[j],
                     glq_nodes,
                     glq_weights,
                     kernel,
                 )
+                continue
+            # Apply adaptive discretization on the tesseroid, evaluating the
+            # quadrature on each small tesseroid as soon as it is produced
+            result[i] += _adaptive_discretization_glq(
+                longitude_rad[i],
+                cosphi[i],
+                sinphi[i],
+                radius[i],
+                tesseroids[j, :],
+                density[j],
+                distance_size_ratio,
+                stack[thread_id],
+                radial_adaptive_discretization,
+                glq_nodes,
+                glq_weights,
+                kernel,
+                gauss_legendre_quadrature,
+            )
         # Update progress bar
         if update_progressbar:
             progress_proxy.update(1)
@@ -385,10 +452,10 @@ def jit_tesseroid_gravity_variable_density(
         tesseroid only on the horizontal direction.
         If ``True``, it will perform a three dimensional adaptive
         discretization, splitting the tesseroids on every direction.
-    glq_nodes : list
-        List containing unscaled GLQ nodes.
-    glq_weights : list
-        List containing GLQ weights of the nodes.
+    glq_nodes : 2d-array
+        Array containing unscaled GLQ nodes, one row per direction.
+    glq_weights : 2d-array
+        Array containing GLQ weights of the nodes, one row per direction.
     kernel : func
         Kernel function for the gravitational field of point masses.
     dtype : data-type
@@ -404,46 +471,184 @@ def jit_tesseroid_gravity_variable_density(
     longitude_rad = np.radians(longitude)
     cosphi = np.cos(np.radians(latitude))
     sinphi = np.sin(np.radians(latitude))
+    # Precompute the dimensions of every tesseroid: they are shared by all
+    # computation points and let us skip the discretization machinery for
+    # tesseroids that are far enough from the observer
+    n_tesseroids = tesseroids.shape[0]
+    dimensions = np.empty((n_tesseroids, 3), dtype=dtype)
+    for j in range(n_tesseroids):
+        l_lon, l_lat, l_rad = _tesseroid_dimensions(tesseroids[j, :])
+        dimensions[j, 0] = l_lon
+        dimensions[j, 1] = l_lat
+        dimensions[j, 2] = l_rad
+    # Allocate the stack scratch buffer once per thread: every computation
+    # point handled by a thread reuses the same memory instead of allocating
+    # fresh arrays on each iteration
+    stack = np.empty((get_num_threads(), STACK_SIZE, 6), dtype=dtype)
     # Loop over computation points
     for i in prange(longitude.size):
-        # Initialize arrays to perform memory allocation only once
-        stack = np.empty((STACK_SIZE, 6), dtype=dtype)
-        small_tesseroids = np.empty((MAX_DISCRETIZATIONS, 6), dtype=dtype)
+        thread_id = get_thread_id()
         # Loop over tesseroids
         for j in range(tesseroids.shape[0]):
-            # Apply adaptive discretization on tesseroid
-            n_splits = _adaptive_discretization(
-                (longitude[i], latitude[i], radius[i]),
-                tesseroids[j, :],
-                distance_size_ratio,
-                stack,
-                small_tesseroids,
-                radial_adaptive_discretization,
+            # Skip the adaptive discretization when the tesseroid is far
+            # enough that no splitting would take place: the cached
+            # dimensions make this a cheap distance check and the quadrature
+            # can run directly on the whole tesseroid
+            distance = _distance_tesseroid_point_fast(
+                longitude_rad[i], cosphi[i], sinphi[i], radius[i], tesseroids[j, :]
             )
-            # Compute effect of the tesseroid through GLQ
-            for tess_index in range(n_splits):
-                tesseroid = small_tesseroids[tess_index, :]
+            no_split = (
+                distance / dimensions[j, 0] >= distance_size_ratio
+                and distance / dimensions[j, 1] >= distance_size_ratio
+                and (
+                    not radial_adaptive_discretization
+                    or distance / dimensions[j, 2] >= distance_size_ratio
+                )
+            )
+            if no_split:
                 result[i] += gauss_legendre_quadrature_variable_density(
                     longitude_rad[i],
                     cosphi[i],
                     sinphi[i],
                     radius[i],
-                    tesseroid,
+                    tesseroids[j, :],
                     density,
                     glq_nodes,
                     glq_weights,
                     kernel,
                 )
+                continue
+            # Apply adaptive discretization on the tesseroid, evaluating the
+            # quadrature on each small tesseroid as soon as it is produced
+            result[i] += _adaptive_discretization_glq(
+                longitude_rad[i],
+                cosphi[i],
+                sinphi[i],
+                radius[i],
+                tesseroids[j, :],
+                density,
+                distance_size_ratio,
+                stack[thread_id],
+                radial_adaptive_discretization,
+                glq_nodes,
+                glq_weights,
+                kernel,
+                gauss_legendre_quadrature_variable_density,
+            )
         # Update progress bar
         if update_progressbar:
             progress_proxy.update(1)
 
 
+def jit_tesseroid_gravity_over_tesseroids(
+    coordinates,
+    tesseroids,
+    density,
+    result,
+    distance_size_ratio,
+    radial_adaptive_discretization,
+    glq_nodes,
+    glq_weights,
+    kernel,
+    dtype,
+    progress_proxy,
+):
+    """
+    Compute gravitational field of tesseroids parallelizing over tesseroids.
+
+    Variant of :func:`jit_tesseroid_gravity` where the parallel loop runs over
+    the tesseroids instead of the computation points. It should be preferred
+    when the number of computation points is too small to keep every thread
+    busy. Since several threads contribute to the same computation point, each
+    thread accumulates on a private copy of the result array and the copies
+    are reduced after the loop.
+
+    Parameters are the same as :func:`jit_tesseroid_gravity`.
+    """
+    # Check if we need to update the progressbar on each iteration
+    update_progressbar = progress_proxy is not None
+    # Get coordinates of the observation points
+    # and precompute trigonometric functions
+    longitude, latitude, radius = coordinates[:]
+    longitude_rad = np.radians(longitude)
+    cosphi = np.cos(np.radians(latitude))
+    sinphi = np.sin(np.radians(latitude))
+    n_points = longitude.size
+    n_tesseroids = tesseroids.shape[0]
+    # Allocate the per-thread scratch buffers: the stack for the adaptive
+    # discretization and a private copy of the result array, so threads
+    # working on different tesseroids never write to the same entries
+    n_threads = get_num_threads()
+    stack = np.empty((n_threads, STACK_SIZE, 6), dtype=dtype)
+    result_per_thread = np.zeros((n_threads, n_points), dtype=dtype)
+    # Loop over tesseroids
+    for j in prange(n_tesseroids):
+        thread_id = get_thread_id()
+        l_lon, l_lat, l_rad = _tesseroid_dimensions(tesseroids[j, :])
+        # Loop over computation points
+        for i in range(n_points):
+            # Skip the adaptive discretization when the tesseroid is far
+            # enough that no splitting would take place
+            distance = _distance_tesseroid_point_fast(
+                longitude_rad[i], cosphi[i], sinphi[i], radius[i], tesseroids[j, :]
+            )
+            no_split = (
+                distance / l_lon >= distance_size_ratio
+                and distance / l_lat >= distance_size_ratio
+                and (
+                    not radial_adaptive_discretization
+                    or distance / l_rad >= distance_size_ratio
+                )
+            )
+            if no_split:
+                result_per_thread[thread_id, i] += gauss_legendre_quadrature(
+                    longitude_rad[i],
+                    cosphi[i],
+                    sinphi[i],
+                    radius[i],
+                    tesseroids[j, :],
+                    density[j],
+                    glq_nodes,
+                    glq_weights,
+                    kernel,
+                )
+                continue
+            # Apply adaptive discretization on the tesseroid, evaluating the
+            # quadrature on each small tesseroid as soon as it is produced
+            result_per_thread[thread_id, i] += _adaptive_discretization_glq(
+                longitude_rad[i],
+                cosphi[i],
+                sinphi[i],
+                radius[i],
+                tesseroids[j, :],
+                density[j],
+                distance_size_ratio,
+                stack[thread_id],
+                radial_adaptive_discretization,
+                glq_nodes,
+                glq_weights,
+                kernel,
+                gauss_legendre_quadrature,
+            )
+    # Reduce the per-thread accumulators into the result array
+    for thread_id in range(n_threads):
+        for i in range(n_points):
+            result[i] += result_per_thread[thread_id, i]
+    # Update progress bar
+    # (the progress is tracked per computation point, but here the points are
+    # revisited on every tesseroid, so report them all at once at the end)
+    if update_progressbar:
+        progress_proxy.update(n_points)
+
+
 # Define jitted versions of the forward modelling function
 jit_tesseroid_gravity_serial = jit(nopython=True)(jit_tesseroid_gravity)
 jit_tesseroid_gravity_parallel = jit(nopython=True, parallel=True)(
     jit_tesseroid_gravity
 )
+jit_tesseroid_gravity_over_tesseroids_parallel = jit(nopython=True, parallel=True)(
+    jit_tesseroid_gravity_over_tesseroids
+)
 jit_tesseroid_gravity_variable_density_serial = jit(nopython=True)(
     jit_tesseroid_gravity_variable_density
 )
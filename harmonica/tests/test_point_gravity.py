@@ -659,26 +659,30 @@ def test_point_mass_same_radial_direction(field):
     """
     sphere_radius = 3.0
     mass = 2.0
+    heights = np.logspace(0, 4, 5)
+    results = []
     for longitude in np.linspace(-180, 180, 37):
         for latitude in np.linspace(-90, 90, 19):
-            for height in np.logspace(0, 4, 5):
-                point_mass = [longitude, latitude, sphere_radius]
-                coordinates = [
-                    np.array(longitude),
-                    np.array(latitude),
-                    np.array(height + sphere_radius),
-                ]
-                # Analytical solutions
-                # (accelerations are in mGal and tensor components in eotvos)
-                analytical = {
-                    "potential": GRAVITATIONAL_CONST * mass / height,
-                    "g_z": GRAVITATIONAL_CONST * mass / height**2 * 1e5,
-                }
-                # Compare results with analytical solutions
-                npt.assert_allclose(
-                    point_gravity(coordinates, point_mass, mass, field, "spherical"),
-                    analytical[field],
-                )
+            # Vectorize over the heights: the point mass sits right below
+            # every computation point, so a single call covers all of them
+            point_mass = [longitude, latitude, sphere_radius]
+            coordinates = [
+                np.full_like(heights, longitude),
+                np.full_like(heights, latitude),
+                heights + sphere_radius,
+            ]
+            results.append(
+                point_gravity(coordinates, point_mass, mass, field, "spherical")
+            )
+    # Analytical solutions, identical for every point mass location
+    # (accelerations are in mGal and tensor components in eotvos)
+    analytical = {
+        "potential": GRAVITATIONAL_CONST * mass / heights,
+        "g_z": GRAVITATIONAL_CONST * mass / heights**2 * 1e5,
+    }
+    # Compare all results with the analytical solutions at once
+    results = np.stack(results)
+    npt.assert_allclose(results, np.broadcast_to(analytical[field], results.shape))
 
 
 @pytest.mark.use_numba
@@ -19,6 +19,7 @@ import verde as vd
 from verde import grid_coordinates
 
 from .._forward._tesseroid_utils import (
+    _adaptive_discretization,
     _discard_null_tesseroids,
     _distance_tesseroid_point,
     _longitude_continuity,
@@ -28,7 +29,6 @@ from .._forward._tesseroid_utils import (
 from .._forward.tesseroid import (
     MAX_DISCRETIZATIONS,
     STACK_SIZE,
-    _adaptive_discretization,
     _check_tesseroids,
     check_points_outside_tesseroids,
     tesseroid_gravity,
@@ -319,21 +319,36 @@ class TestPointInsideTesseroid:
 def test_stack_overflow_on_adaptive_discretization():
     """Test if _adaptive_discretization raises OverflowError on stack overflow."""
     tesseroid = np.array([-10.0, 10.0, -10.0, 10.0, 0.5, 1.0])
-    coordinates = np.array([0.0, 0.0, 1.0])
+    # Computation point on the equator and prime meridian
+    longitude, cosphi, sinphi, radius = 0.0, 1.0, 0.0, 1.0
     distance_size_ratio = 10
     # Test stack overflow
     stack = np.empty((2, 6))
     small_tesseroids = np.empty((MAX_DISCRETIZATIONS, 6))
     with pytest.raises(OverflowError):
         _adaptive_discretization(
-            coordinates, tesseroid, distance_size_ratio, stack, small_tesseroids
+            longitude,
+            cosphi,
+            sinphi,
+            radius,
+            tesseroid,
+            distance_size_ratio,
+            stack,
+            small_tesseroids,
         )
     # Test small_tesseroids overflow
     stack = np.empty((STACK_SIZE, 6))
     small_tesseroids = np.empty((2, 6))
     with pytest.raises(OverflowError):
         _adaptive_discretization(
-            coordinates, tesseroid, distance_size_ratio, stack, small_tesseroids
+            longitude,
+            cosphi,
+            sinphi,
+            radius,
+            tesseroid,
+            distance_size_ratio,
+            stack,
+            small_tesseroids,
         )
 
 
@@ -597,11 +612,15 @@ def test_adaptive_discretization_on_radii(radial_discretization):
         radii.insert(0, 10.1)
     else:
         radii.insert(0, 10.0)
+    # Computation points located on the equator and prime meridian
+    longitude, cosphi, sinphi = 0.0, 1.0, 0.0
     number_of_splits = []
     for radius in radii:
-        coordinates = np.array([0.0, 0.0, radius])
         n_splits = _adaptive_discretization(
-            coordinates,
+            longitude,
+            cosphi,
+            sinphi,
+            radius,
             tesseroid,
             distance_size_ratio,
             stack,
@@ -618,14 +637,18 @@ def test_adaptive_discretization_on_radii(radial_discretization):
 def test_adaptive_discretization_vs_distance_size_ratio(radial_discretization):
     """Test if higher distance-size-ratio increase the tesseroid discretization."""
     tesseroid = np.array([-10.0, 10.0, -10.0, 10.0, 1.0, 10.0])
-    coordinates = np.array([0.0, 0.0, 10.2])
+    # Computation point on the equator and prime meridian
+    longitude, cosphi, sinphi, radius = 0.0, 1.0, 0.0, 10.2
     distance_size_ratii = np.linspace(1, 10, 10)
     stack = np.empty((STACK_SIZE, 6))
     small_tesseroids = np.empty((MAX_DISCRETIZATIONS, 6))
     number_of_splits = []
     for distance_size_ratio in distance_size_ratii:
         n_splits = _adaptive_discretization(
-            coordinates,
+            longitude,
+            cosphi,
+            sinphi,
+            radius,
             tesseroid,
             distance_size_ratio,
             stack,
@@ -644,12 +667,20 @@ def test_two_dimensional_adaptive_discretization():
     """
     bottom, top = 1.0, 10.0
     tesseroid = np.array([-10.0, 10.0, -10.0, 10.0, bottom, top])
-    coordinates = np.array([0.0, 0.0, top])
+    # Computation point on the equator and prime meridian
+    longitude, cosphi, sinphi, radius = 0.0, 1.0, 0.0, top
     stack = np.empty((STACK_SIZE, 6))
     small_tesseroids = np.empty((MAX_DISCRETIZATIONS, 6))
     distance_size_ratio = 10
     n_splits = _adaptive_discretization(
-        coordinates, tesseroid, distance_size_ratio, stack, small_tesseroids
+        longitude,
+        cosphi,
+        sinphi,
+        radius,
+        tesseroid,
+        distance_size_ratio,
+        stack,
+        small_tesseroids,
     )
     small_tesseroids = small_tesseroids[:n_splits]
     for tess in small_tesseroids:
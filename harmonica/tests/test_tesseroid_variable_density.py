@@ -232,7 +232,10 @@ def test_single_density_based_discretization(
     # Define some dummy horizontal coordinates for the tesseroid
     w, e, s, n = -3, 2, -4, 5
     tesseroid = w, e, s, n, bottom, top
-    tesseroids = _density_based_discretization(tesseroid, quadratic_density)
+    out, count = _density_based_discretization(
+        tesseroid, quadratic_density, np.empty((4, 6)), 0
+    )
+    tesseroids = out[:count]
     # With the default value of DELTA=0.1, it should produce only 2 tesseroids
     assert len(tesseroids) == 2
     # Check the horizontal coordinates of the tesseroids
@@ -270,7 +273,10 @@ def test_density_based_discret_with_delta(
         # Override the DELTA_RATIO global variable
         harmonica._forward._tesseroid_variable_density.DELTA_RATIO = delta
         # Count the splits generated by density based discretization
-        splits.append(len(_density_based_discretization(tesseroid, quadratic_density)))
+        _, count = _density_based_discretization(
+            tesseroid, quadratic_density, np.empty((4, 6)), 0
+        )
+        splits.append(count)
     splits = np.array(splits)
     # Check if numbers of splits increases for lower deltas
     assert (splits[1:] < splits[:-1]).all()
@@ -289,7 +295,10 @@ def test_density_based_discret_linear_density():
         """Define a dummy linear density."""
         return 3 * radius + 2
 
-    tesseroids = _density_based_discretization(tesseroid, linear_density)
+    out, count = _density_based_discretization(
+        tesseroid, linear_density, np.empty((4, 6)), 0
+    )
+    tesseroids = out[:count]
     assert len(tesseroids) == 1
     npt.assert_allclose(tesseroids[0], tesseroid)
 
@@ -310,7 +319,10 @@ def test_density_based_discret_constant_density():
         """Define a dummy constant density function."""
         return 3
 
-    tesseroids = _density_based_discretization(tesseroid, stupid_constant_density)
+    out, count = _density_based_discretization(
+        tesseroid, stupid_constant_density, np.empty((4, 6)), 0
+    )
+    tesseroids = out[:count]
     assert len(tesseroids) == 1
     npt.assert_allclose(tesseroids[0], tesseroid)
 